@@ -1,9 +1,11 @@
-from typing import Any, Union
+from typing import Any, Iterator, Optional, Union
 
 from mysql.connector import pooling
 from tqdm.auto import tqdm
 
 from src.MorphemeAnalyzer import MorphemeAnalyzer
+from src.NounTagMemo import NounTagMemo
+from src.TagCache import TagCache
 from src.TagExtractor import TagExtractor
 
 
@@ -67,11 +69,27 @@ class DatabaseController:
         PRIMARY KEY (id, post_id)
     );
 
+    CREATE TABLE keyword_tag_memo
+    (
+        keyword          VARCHAR(20)   NOT NULL,
+        similarity_point DECIMAL(6, 5) NOT NULL,
+        version          CHAR(64)      NOT NULL,
+        tag              VARCHAR(20),
+        value            FLOAT,
+        PRIMARY KEY (version, keyword, similarity_point)
+    );
+
     """
 
-    def __init__(self, user: str, password: str, host: str, db: str):
-        self.connection_pool = pooling.MySQLConnectionPool(pool_reset_session=True, user=user, password=password,
-                                                           host=host, database=db, autocommit=True)
+    def __init__(self, user: str, password: str, host: str, db: str, pool_size: int = 5):
+        """
+        :param pool_size: 연결 풀에 유지할 데이터베이스 연결 수
+        """
+        # keyword, keyword_tag_memo 테이블의 명사 열 길이 (VARCHAR(20))
+        self.keyword_max_length = 20
+        self.connection_pool = pooling.MySQLConnectionPool(pool_size=pool_size, pool_reset_session=True, user=user,
+                                                           password=password, host=host, database=db,
+                                                           autocommit=True)
 
     def _execute(self, sql: str, args: Union[tuple, list] = None) -> Any:
         """
@@ -85,6 +103,17 @@ class DatabaseController:
         connection.close()
         return result_list
 
+    def _execute_many(self, sql: str, args_list: list[Union[tuple, list]]):
+        """
+        하나의 연결로 여러 인자에 대해 SQL 쿼리 실행
+        """
+        if not args_list:
+            return
+        connection = self.connection_pool.get_connection()
+        cursor = connection.cursor()
+        cursor.executemany(operation=sql, seq_params=args_list)
+        connection.close()
+
     def get_tag_set(self):
         """
         :return: 데이터베이스에 기록되어 있는 기본 태그들
@@ -108,6 +137,46 @@ class DatabaseController:
         author = self._none_check(text=result_list[0][2])
         return title, post_text, author
 
+    def count_posts(self, answered_only: bool = False) -> int:
+        """
+        :param answered_only: answer_tag_post 테이블에 정답 태그가 있는 게시글만 셀지 여부
+        :return: 게시글 수
+        """
+        sql = 'SELECT count(id) FROM post'
+        if answered_only:
+            sql += ' WHERE id IN (SELECT post_id FROM answer_tag_post)'
+        return int(self._execute(sql=sql)[0][0])
+
+    def iter_posts(self, batch_size: int = 500, answered_only: bool = False) -> Iterator[tuple[int, str, str, str]]:
+        """
+        모든 게시글을 id 순서대로 batch_size개씩 나누어 읽음 (id > 마지막 id LIMIT n).
+        한 묶음을 읽을 때마다 연결을 하나만 사용하므로, 전체 게시글을 일정한 메모리로 읽을 수 있음
+        :param batch_size: 한 번에 읽을 게시글 수
+        :param answered_only: answer_tag_post 테이블에 정답 태그가 있는 게시글만 읽을지 여부
+        :return: 게시글 정보 (게시글 번호, 제목, 게시글, 작성자)
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size는 1 이상이어야 합니다.')
+        sql = 'SELECT id, title, content, author FROM post WHERE id > (%s)'
+        if answered_only:
+            sql += ' AND id IN (SELECT post_id FROM answer_tag_post)'
+        sql += ' ORDER BY id LIMIT %s'
+        return self._iter_posts(sql=sql, batch_size=batch_size)
+
+    def _iter_posts(self, sql: str, batch_size: int) -> Iterator[tuple[int, str, str, str]]:
+        """
+        iter_posts의 묶음 단위 조회 (인자 검사가 첫 반복이 아닌 호출 시점에 이루어지도록 분리함)
+        """
+        last_id = 0
+        while True:
+            result_list = self._execute(sql=sql, args=(last_id, batch_size))
+            for post_id, title, content, author in result_list:
+                yield post_id, self._none_check(text=title), self._none_check(text=content), self._none_check(
+                    text=author)
+            if len(result_list) < batch_size:
+                break
+            last_id = result_list[-1][0]
+
     def save_keywords(self, post_id: int, keyword_list: list[str, float]):
         """
         모든 키워드들 저장
@@ -134,6 +203,41 @@ class DatabaseController:
             self._execute(sql='INSERT IGNORE INTO keyword (name) VALUES (%s)', args=[keyword])
             self.save_keyword(post_id=post_id, keyword=keyword, value=value)
 
+    def load_noun_tag_memo(self, version: str, limit: int) -> list[tuple[str, float, Optional[str], Optional[float]]]:
+        """
+        해당 태그 목록 버전으로 기억된 명사별 최종 태그 반환
+        :param version: 태그 목록 버전
+        :param limit: 최대 반환 개수
+        :return: (명사, 유사도 기준점, 태그, 유사도) 배열
+        """
+        result_list = []
+        for keyword, similarity_point, tag, value in self._execute(
+                sql='SELECT keyword, similarity_point, tag, value FROM keyword_tag_memo WHERE version = (%s) LIMIT %s',
+                args=(version, limit)):
+            result_list.append((keyword, float(similarity_point), tag, None if value is None else float(value)))
+        return result_list
+
+    def save_noun_tag_memo(self, version: str, memo_list: list[tuple[str, float, Optional[str], Optional[float]]]):
+        """
+        명사별 최종 태그 저장. keyword 열보다 긴 명사는 잘려서 다른 명사와 섞이지 않도록 저장하지 않음
+        :param version: 태그 목록 버전
+        :param memo_list: (명사, 유사도 기준점, 태그, 유사도) 배열
+        """
+        args_list = [(keyword, similarity_point, version, tag, value)
+                     for keyword, similarity_point, tag, value in memo_list
+                     if len(keyword) <= self.keyword_max_length]
+        self._execute_many(
+            sql='INSERT IGNORE INTO keyword_tag_memo (keyword, similarity_point, version, tag, value) VALUES (%s, %s, %s, %s, %s)',
+            args_list=args_list)
+
+    def delete_noun_tag_memo(self, version: str):
+        """
+        해당 태그 목록 버전의 명사별 최종 태그 삭제.
+        여러 작업 프로세스가 테이블을 공유하므로, 더 이상 사용되지 않는 버전을 정리할 때만 직접 호출해야 함
+        :param version: 삭제할 태그 목록 버전
+        """
+        self._execute(sql='DELETE FROM keyword_tag_memo WHERE version = (%s)', args=[version])
+
     def save_tags(self, post_id: int, tag_list: list[str]):
         """
         모든 태그들 저장
@@ -160,13 +264,30 @@ class DatabaseController:
 
 
 class SETagExtractor:
-    def __init__(self, user: str, password: str, host: str, db: str):
-        self.database_controller = DatabaseController(user=user, password=password, host=host, db=db)
+    def __init__(self, user: str, password: str, host: str, db: str, cache_size: int = 1024,
+                 cache_path: str = None, pool_size: int = 5, noun_tag_memo_size: int = 100000,
+                 persist_noun_tag_memo: bool = False, cache_persistent_size: int = 100000):
+        """
+        :param pool_size: 연결 풀에 유지할 데이터베이스 연결 수
+        :param noun_tag_memo_size: 메모리에 기억할 명사별 최종 태그 수
+        :param persist_noun_tag_memo: 명사별 최종 태그를 keyword_tag_memo 테이블에 저장 및 불러올지 여부
+        :param cache_size: 메모리에 캐시할 태그 추출 결과 수
+        :param cache_path: 작업 프로세스 간에 공유할 SQLite 캐시 파일 경로 (None일 경우 메모리 캐시만 사용)
+        :param cache_persistent_size: SQLite 캐시에 저장할 최대 결과 수 (넘으면 오래된 결과부터 삭제)
+        """
+        self.database_controller = DatabaseController(user=user, password=password, host=host, db=db,
+                                                      pool_size=pool_size)
         tag_set = self.database_controller.get_tag_set()
         morpheme_analyzer = MorphemeAnalyzer(is_typos=True)
         for tag in tag_set:
             morpheme_analyzer.add_user_word(word=tag)
-        self.tag_extractor = TagExtractor(tag_set=tag_set, morpheme_analyzer=morpheme_analyzer)
+        self.tag_cache = TagCache(max_size=cache_size, db_path=cache_path, persistent_max_size=cache_persistent_size)
+        self.persist_noun_tag_memo = persist_noun_tag_memo
+        self.noun_tag_memo_size = noun_tag_memo_size
+        self.noun_tag_memo = NounTagMemo(max_size=noun_tag_memo_size, track_pending=persist_noun_tag_memo)
+        self.tag_extractor = TagExtractor(tag_set=tag_set, morpheme_analyzer=morpheme_analyzer,
+                                          tag_cache=self.tag_cache, noun_tag_memo=self.noun_tag_memo)
+        self._load_noun_tag_memo()
 
     def get_tags(self, post_id: int) -> list[str]:
         """
@@ -175,13 +296,66 @@ class SETagExtractor:
         :return: 게시글에 달린 태그
         """
         title, post_text, author = self.database_controller.get_data(post_id=post_id)
+        return self._tag_post(post_id=post_id, title=title, post_text=post_text)
+
+    def _tag_post(self, post_id: int, title: str, post_text: str) -> list[str]:
+        """
+        이미 읽어온 게시글에 대한 키워드와 태그를 저장 및 반환
+        :param post_id: 게시글 id
+        :param title: 제목
+        :param post_text: 게시글 본문
+        :return: 게시글에 달린 태그
+        """
         tag_list, keyword_list = self.tag_extractor.get_tags(title=title, post_text=post_text, return_keyword=True)
         self.database_controller.save_keywords(post_id=post_id, keyword_list=keyword_list)
         self.database_controller.save_tags(post_id=post_id, tag_list=tag_list)
+        if self.persist_noun_tag_memo:
+            self.database_controller.save_noun_tag_memo(version=self.tag_extractor.tag_set_version,
+                                                        memo_list=self.noun_tag_memo.pop_pending())
         return tag_list
 
-    def add_tag(self, tag: str):
+    def get_cache_stats(self) -> dict[str, int]:
+        """
+        :return: 태그 추출 결과 캐시 적중 통계
+        """
+        return self.tag_cache.get_stats()
+
+    def delete_cache_version(self, version: str):
+        """
+        더 이상 사용되지 않는 태그 목록 버전의 태그 추출 결과를 공유 캐시에서 삭제
+        :param version: 삭제할 태그 목록 버전 (현재 버전은 삭제할 수 없음)
+        """
+        if version == self.tag_extractor.tag_set_version:
+            raise ValueError('현재 사용 중인 태그 목록 버전은 삭제할 수 없습니다.')
+        self.tag_cache.delete_version(version=version)
+
+    def delete_noun_tag_memo_version(self, version: str):
+        """
+        더 이상 사용되지 않는 태그 목록 버전의 명사별 최종 태그를 keyword_tag_memo 테이블에서 삭제
+        :param version: 삭제할 태그 목록 버전 (현재 버전은 삭제할 수 없음)
+        """
+        if version == self.tag_extractor.tag_set_version:
+            raise ValueError('현재 사용 중인 태그 목록 버전은 삭제할 수 없습니다.')
+        self.database_controller.delete_noun_tag_memo(version=version)
+
+    def get_noun_tag_memo_stats(self) -> dict[str, int]:
+        """
+        :return: 명사별 최종 태그 메모 적중 통계
+        """
+        return self.noun_tag_memo.get_stats()
+
+    def add_tag(self, tag: str, similarity_point: float = 0.75):
+        """
+        기본 태그를 추가하고, 저장된 키워드 중 새 태그와 유사한 키워드가 있는 게시글에 태그를 저장
+        :param tag: 추가할 태그
+        :param similarity_point: 유사도 비교 필터링 기준점
+        """
         self.database_controller._execute(sql='INSERT INTO tag(name) VALUE (%s)', args=[tag])
+        # 태그 목록이 바뀌었으므로 캐시된 결과와 명사별 최종 태그 무효화 후, 새 버전으로 저장된 명사별 최종 태그 불러오기
+        self.tag_extractor.set_tag_set(tag_set=self.database_controller.get_tag_set())
+        self._load_noun_tag_memo()
+        self.tag_extractor.morpheme_analyzer.add_user_word(word=tag)
+
         keyword_dict = dict()
         for inner in self.database_controller._execute(
                 sql='SELECT keyword_post.post_id, keyword.name FROM (keyword_post left join keyword on keyword_post.keyword_id = keyword.id)'):
@@ -192,18 +366,31 @@ class SETagExtractor:
                 keyword_dict.get(post_id).append(keyword)
 
         for post_id in keyword_dict.keys():
-            if self.tag_extractor.similarity_comparator.is_similar(tag, keyword_dict.get(post_id),
-                                                                   point=self.similarity_point):
-                self.database_controller.save_tag(post_id=post_id, tag=tag)
+            for keyword in keyword_dict.get(post_id):
+                if self.tag_extractor.similarity_comparator.is_similar(word1=tag, word2=keyword,
+                                                                       point=similarity_point):
+                    self.database_controller.save_tag(post_id=post_id, tag=tag)
+                    break
 
-        self.tag_extractor._get_tags()
+    def _load_noun_tag_memo(self):
+        """
+        다른 작업 프로세스가 현재 태그 목록 버전으로 저장한 명사별 최종 태그 불러오기
+        """
+        if self.persist_noun_tag_memo:
+            self.noun_tag_memo.load(memo_list=self.database_controller.load_noun_tag_memo(
+                version=self.tag_extractor.tag_set_version, limit=self.noun_tag_memo_size))
 
-    def tag_all(self, reset_keyword_post_table: bool = False, reset_tag_post_table: bool = False):
+    def tag_all(self, reset_keyword_post_table: bool = False, reset_tag_post_table: bool = False,
+                batch_size: int = 500):
+        """
+        모든 게시글에 대한 키워드와 태그 저장
+        :param batch_size: 데이터베이스에서 한 번에 읽을 게시글 수
+        """
         if reset_keyword_post_table:
             self.database_controller._execute('DELETE FROM keyword_post')
         if reset_tag_post_table:
             self.database_controller._execute('DELETE FROM tag_post')
-        for inner in tqdm(self.database_controller._execute('SELECT id FROM post'), ascii=True, dynamic_ncols=True,
-                          desc='tagging'):
-            id = inner[0]
-            self.get_tags(post_id=id)
+        for id, title, post_text, author in tqdm(self.database_controller.iter_posts(batch_size=batch_size),
+                                                 total=self.database_controller.count_posts(), ascii=True,
+                                                 dynamic_ncols=True, desc='tagging'):
+            self._tag_post(post_id=id, title=title, post_text=post_text)
@@ -19,10 +19,7 @@ class SETagExtractorTest:
             else:
                 self.answer_list.get(post_id).append(tag_id)
 
-        self.post_list = []
-        for id, title, content, author, _ in self.database._execute(
-                'SELECT * FROM post WHERE id IN (SELECT post_id FROM answer_tag_post)'):
-            self.post_list.append((id, title, content, author))
+        self.amount_of_post = self.database.count_posts(answered_only=True)
 
         self.tag_set = self.database.get_tag_set()
         self.morpheme_analyzer = MorphemeAnalyzer()
@@ -34,7 +31,7 @@ class SETagExtractorTest:
         sum_of_percent_in_tag_list = .0
         sum_of_percent_in_answer = .0
         tag_extractor = TagExtractor(tag_set=self.tag_set, morpheme_analyzer=self.morpheme_analyzer)
-        for id, title, content, author in self.post_list:
+        for id, title, content, author in self.database.iter_posts(answered_only=True):
             hit_count = 0
             tag_list = tag_extractor.get_tags(title=title, post_text=content, keyword_ngram_range=ngram_range,
                                               score_point=score_point,
@@ -54,8 +51,8 @@ class SETagExtractorTest:
                 # print(str(id) + ' tag :' + str(tag_list) + ', answer:' + str(self.answer_list[id]) + ', score:' + str(
             #         percent) + '%')
 
-        answer_in_tag_list = sum_of_percent_in_tag_list / len(self.post_list)
-        tag_in_answer = sum_of_percent_in_answer / len(self.post_list)
+        answer_in_tag_list = sum_of_percent_in_tag_list / self.amount_of_post
+        tag_in_answer = sum_of_percent_in_answer / self.amount_of_post
         accuracy = (answer_in_tag_list + tag_in_answer) / 2
         return [ngram_range, score_point, similarity_point, answer_in_tag_list, tag_in_answer, accuracy]
 
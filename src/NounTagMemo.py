@@ -0,0 +1,86 @@
+from typing import Optional
+
+from .VersionedLRUCache import VersionedLRUCache
+
+
+class NounTagMemo:
+    # keyword_tag_memo 테이블의 similarity_point 열(DECIMAL(6, 5))과 같은 자릿수로 기준점을 반올림하여 키로 사용
+    similarity_point_digits = 5
+
+    def __init__(self, max_size: int = 100000, track_pending: bool = False):
+        """
+        (명사, 유사도 기준점)에 대해 가장 유사한 기본 태그를 기억하는 메모 테이블.
+        결과는 태그 목록에만 의존하므로 태그 목록 버전이 바뀌면 모두 무효화됨
+        :param max_size: 메모리에 저장할 최대 명사 수 (가장 오래 사용되지 않은 명사부터 삭제)
+        :param track_pending: 새로 계산된 결과를 영구 저장소에 기록하기 위해 따로 모아둘지 여부
+        """
+        self.track_pending = track_pending
+        self._memo = VersionedLRUCache(max_size=max_size)
+        self._pending_list: list[tuple[str, float, Optional[str], Optional[float]]] = []
+
+    @property
+    def version(self) -> str:
+        """
+        :return: 현재 태그 목록 버전
+        """
+        return self._memo.version
+
+    def set_version(self, version: str):
+        """
+        태그 목록 버전 재설정. 버전이 바뀌면 기억된 결과는 모두 삭제됨
+        :param version: 태그 목록 버전 (TagCache.get_tag_set_version 참고)
+        """
+        if self._memo.set_version(version=version):
+            self._pending_list = []
+
+    def get(self, noun: str, similarity_point: float) -> Optional[tuple[Optional[str], Optional[float]]]:
+        """
+        기억된 결과 반환
+        :param noun: 명사
+        :param similarity_point: 유사도 비교 필터링 기준점
+        :return: (태그, 유사도), 일치하는 태그가 없는 경우 (None, None), 기억되지 않은 경우 None
+        """
+        return self._memo.get(key=self._make_key(noun=noun, similarity_point=similarity_point))
+
+    def put(self, noun: str, similarity_point: float, tag: Optional[str], similarity: Optional[float]):
+        """
+        계산된 결과 저장. track_pending이 활성화된 경우, 새로 저장된 결과는 pop_pending으로 꺼내 영구 저장소에 기록할 수 있음
+        :param noun: 명사
+        :param similarity_point: 유사도 비교 필터링 기준점
+        :param tag: 가장 유사한 기본 태그 (없는 경우 None)
+        :param similarity: 해당 태그와의 유사도 (없는 경우 None)
+        """
+        similarity = None if similarity is None else float(similarity)
+        key = self._make_key(noun=noun, similarity_point=similarity_point)
+        self._memo.put(key=key, value=(tag, similarity))
+        if self.track_pending:
+            self._pending_list.append((noun, key[1], tag, similarity))
+
+    def load(self, memo_list: list[tuple[str, float, Optional[str], Optional[float]]]):
+        """
+        영구 저장소에서 읽어온 결과를 메모리에 불러옴
+        :param memo_list: (명사, 유사도 기준점, 태그, 유사도) 배열
+        """
+        for noun, similarity_point, tag, similarity in memo_list:
+            self._memo.put(key=self._make_key(noun=noun, similarity_point=similarity_point), value=(tag, similarity))
+
+    def pop_pending(self) -> list[tuple[str, float, Optional[str], Optional[float]]]:
+        """
+        마지막 호출 이후 새로 계산된 결과 반환
+        :return: (명사, 유사도 기준점, 태그, 유사도) 배열
+        """
+        pending_list = self._pending_list
+        self._pending_list = []
+        return pending_list
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        :return: 메모 적중 통계 (hits, misses, size)
+        """
+        return self._memo.get_stats()
+
+    def _make_key(self, noun: str, similarity_point: float) -> tuple[str, float]:
+        """
+        영구 저장소에 저장된 기준점과 같은 키가 되도록 기준점을 반올림
+        """
+        return noun, round(float(similarity_point), self.similarity_point_digits)
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from .VersionedLRUCache import VersionedLRUCache
+
+
+def get_tag_set_version(tag_set: set[str]) -> str:
+    """
+    태그 목록의 버전(지문) 계산. 태그 목록이 같으면 순서와 상관없이 같은 값을 반환함
+    :param tag_set: 기본 태그 목록
+    :return: 태그 목록의 sha256 해시
+    """
+    return hashlib.sha256('\n'.join(sorted(tag_set)).encode('utf-8')).hexdigest()
+
+
+class TagCache:
+    def __init__(self, max_size: int = 1024, db_path: Optional[str] = None, timeout: float = 30.,
+                 persistent_max_size: int = 100000, persistent_max_age: Optional[float] = None,
+                 prune_interval: int = 100):
+        """
+        게시글 내용과 태그 추출 인자를 키로 하는 태그 추출 결과 캐시
+        :param max_size: 메모리 캐시(LRU)에 저장할 최대 결과 수
+        :param db_path: 여러 프로세스가 공유하는 SQLite 캐시 파일 경로 (None일 경우 메모리 캐시만 사용)
+        :param timeout: SQLite 잠금 대기 시간 (초)
+        :param persistent_max_size: SQLite 캐시에 저장할 최대 결과 수 (넘으면 오래된 결과부터 삭제)
+        :param persistent_max_age: SQLite 캐시 결과의 최대 보관 시간 (초, None일 경우 제한 없음)
+        :param prune_interval: SQLite 캐시를 정리하는 저장 횟수 간격
+        """
+        self.db_path = db_path
+        self.timeout = timeout
+        self.persistent_max_size = persistent_max_size
+        self.persistent_max_age = persistent_max_age
+        self.prune_interval = prune_interval
+        self._put_count = 0
+        self._memory_cache = VersionedLRUCache(max_size=max_size)
+        self._local = threading.local()
+        self._persistent_hits = 0
+        self._misses = 0
+        self._persistent_errors = 0
+
+    def set_version(self, version: str):
+        """
+        태그 목록 버전 재설정. 버전이 바뀌면 이전 버전의 결과는 모두 무효화됨
+        (SQLite 캐시는 다른 버전을 사용하는 작업 프로세스와 공유될 수 있으므로 삭제하지 않고, 버전으로 구분하여 조회함)
+        :param version: 태그 목록 버전 (get_tag_set_version 참고)
+        """
+        self._memory_cache.set_version(version=version)
+
+    @property
+    def version(self) -> str:
+        """
+        :return: 현재 태그 목록 버전
+        """
+        return self._memory_cache.version
+
+    def make_key(self, title: str, post_text: str, top_n: int, keyword_ngram_range: tuple[int, int],
+                 score_point: float, similarity_point: float) -> str:
+        """
+        정규화된 제목과 본문, 태그 추출 인자, 태그 목록 버전으로 캐시 키 생성
+        :return: 캐시 키 (sha256 해시)
+        """
+        key_source = json.dumps([self._normalize(title), self._normalize(post_text), top_n,
+                                 list(keyword_ngram_range), score_point, similarity_point, self.version],
+                                ensure_ascii=False)
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[list[str], list[tuple[str, float]]]]:
+        """
+        캐시된 결과 반환
+        :param key: 캐시 키
+        :return: (태그, 키워드) 또는 캐시되지 않은 경우 None
+        """
+        result = self._memory_cache.get(key=key)
+        if result is not None:
+            return result
+
+        if self.db_path is not None:
+            # SQLite 캐시 오류(잠금 시간 초과, 손상된 파일 등)는 캐시되지 않은 것으로 처리하고 태그 추출을 계속함
+            try:
+                row = self._get_connection().execute('SELECT value FROM tag_cache WHERE key = ? AND version = ?',
+                                                     (key, self.version)).fetchone()
+            except sqlite3.Error:
+                self._persistent_errors += 1
+                row = None
+            if row is not None:
+                tag_list, keyword_list = json.loads(row[0])
+                result = (tag_list, [(keyword, score) for keyword, score in keyword_list])
+                self._memory_cache.put(key=key, value=result)
+                self._persistent_hits += 1
+                return result
+
+        self._misses += 1
+        return None
+
+    def put(self, key: str, tag_list: list[str], keyword_list: list[tuple[str, float]]):
+        """
+        태그 추출 결과 저장
+        :param key: 캐시 키
+        :param tag_list: 추출된 태그
+        :param keyword_list: 추출된 키워드와 가중치
+        """
+        value = (list(tag_list), [(keyword, float(score)) for keyword, score in keyword_list])
+        self._memory_cache.put(key=key, value=value)
+        if self.db_path is not None:
+            # SQLite 캐시에 저장하지 못한 경우 메모리 캐시에만 저장함
+            try:
+                connection = self._get_connection()
+                connection.execute('INSERT OR REPLACE INTO tag_cache (key, version, value, created) VALUES (?, ?, ?, ?)',
+                                   (key, self.version, json.dumps(value, ensure_ascii=False), time.time()))
+                connection.commit()
+                self._put_count += 1
+                if self._put_count % self.prune_interval == 0:
+                    self.prune()
+            except sqlite3.Error:
+                self._persistent_errors += 1
+
+    def prune(self):
+        """
+        SQLite 캐시에서 최대 보관 시간이 지난 결과와 최대 결과 수를 넘는 오래된 결과 삭제
+        """
+        if self.db_path is None:
+            return
+        try:
+            connection = self._get_connection()
+            if self.persistent_max_age is not None:
+                connection.execute('DELETE FROM tag_cache WHERE created < ?',
+                                   (time.time() - self.persistent_max_age,))
+            connection.execute(
+                'DELETE FROM tag_cache WHERE key IN (SELECT key FROM tag_cache ORDER BY created DESC, rowid DESC LIMIT -1 OFFSET ?)',
+                (self.persistent_max_size,))
+            connection.commit()
+        except sqlite3.Error:
+            self._persistent_errors += 1
+
+    def delete_version(self, version: str):
+        """
+        해당 태그 목록 버전의 결과 삭제.
+        SQLite 캐시는 여러 작업 프로세스가 공유하므로, 더 이상 사용되지 않는 버전을 정리할 때 사용함
+        :param version: 삭제할 태그 목록 버전
+        """
+        if version == self.version:
+            self._memory_cache.clear()
+        if self.db_path is None:
+            return
+        try:
+            connection = self._get_connection()
+            connection.execute('DELETE FROM tag_cache WHERE version = ?', (version,))
+            connection.commit()
+        except sqlite3.Error:
+            self._persistent_errors += 1
+
+    def clear(self):
+        """
+        메모리 캐시와 SQLite 캐시 모두 삭제
+        """
+        self._memory_cache.clear()
+        if self.db_path is not None:
+            connection = self._get_connection()
+            connection.execute('DELETE FROM tag_cache')
+            connection.commit()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        :return: 캐시 적중 통계 (hits, memory_hits, persistent_hits, misses, persistent_errors, size)
+        """
+        memory_hits = self._memory_cache.get_stats()['hits']
+        return {'hits': memory_hits + self._persistent_hits, 'memory_hits': memory_hits,
+                'persistent_hits': self._persistent_hits, 'misses': self._misses,
+                'persistent_errors': self._persistent_errors, 'size': len(self._memory_cache)}
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        현재 스레드의 SQLite 연결 반환 (다른 스레드나 fork된 작업 프로세스에서는 새로 연결함)
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or getattr(self._local, 'pid', None) != os.getpid():
+            connection = sqlite3.connect(self.db_path, timeout=self.timeout)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('CREATE TABLE IF NOT EXISTS tag_cache '
+                               '(key TEXT PRIMARY KEY, version TEXT NOT NULL, value TEXT NOT NULL, created REAL NOT NULL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS tag_cache_created ON tag_cache (created)')
+            connection.execute('CREATE INDEX IF NOT EXISTS tag_cache_version ON tag_cache (version)')
+            connection.commit()
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _normalize(self, text: str) -> str:
+        """
+        줄바꿈 문자와 앞뒤 공백 차이로 인해 캐시 키가 달라지지 않도록 정규화
+        (내부 공백은 전처리 결과에 영향을 주므로 유지함)
+        """
+        return '' if text is None else text.replace('\r\n', '\n').strip()
@@ -1,17 +1,38 @@
 import re
+from typing import Optional
 
 from .KeywordExtractor import KeywordList, KeywordExtractor
 from .MorphemeAnalyzer import MorphemeAnalyzer
+from .NounTagMemo import NounTagMemo
 from .SimilarityComparator import SimilarityComparator
 from .NamedEntityRecognizer import NamedEntityRecognizer
+from .TagCache import TagCache, get_tag_set_version
 
 
 class TagExtractor:
-    def __init__(self, tag_set: set[str], named_entity_recognizer: NamedEntityRecognizer = NamedEntityRecognizer(),
-                 keyword_extractor: KeywordExtractor = KeywordExtractor(),
-                 morpheme_analyzer: MorphemeAnalyzer = MorphemeAnalyzer(),
-                 similarity_comparator: SimilarityComparator = SimilarityComparator()):
-        self.tag_set = tag_set
+    def __init__(self, tag_set: set[str], named_entity_recognizer: NamedEntityRecognizer = None,
+                 keyword_extractor: KeywordExtractor = None,
+                 morpheme_analyzer: MorphemeAnalyzer = None,
+                 similarity_comparator: SimilarityComparator = None,
+                 tag_cache: TagCache = None, noun_tag_memo: NounTagMemo = None):
+        """
+        분석기가 None일 경우 생성자에서 기본 모델을 생성함 (모듈을 불러올 때 모델을 읽지 않도록 함)
+        :param tag_cache: 태그 추출 결과 캐시 (None일 경우 캐시를 사용하지 않음)
+        :param noun_tag_memo: 명사별 최종 태그 메모 테이블 (None일 경우 메모리에만 기억하는 메모 테이블 사용)
+        """
+        self.tag_set = None
+        self.tag_set_version = None
+        self.tag_cache = tag_cache
+        self.noun_tag_memo = NounTagMemo() if noun_tag_memo is None else noun_tag_memo
+        self.set_tag_set(tag_set=tag_set)
+        if named_entity_recognizer is None:
+            named_entity_recognizer = NamedEntityRecognizer()
+        if keyword_extractor is None:
+            keyword_extractor = KeywordExtractor()
+        if morpheme_analyzer is None:
+            morpheme_analyzer = MorphemeAnalyzer()
+        if similarity_comparator is None:
+            similarity_comparator = SimilarityComparator()
         self.named_entity_recognizer = named_entity_recognizer
         self.keyword_extractor = keyword_extractor
         self.morpheme_analyzer = morpheme_analyzer
@@ -22,11 +43,15 @@ class TagExtractor:
 
     def set_tag_set(self, tag_set: set[str]):
         """
-        기본 태그 목록 재설정
+        기본 태그 목록 재설정. 태그 목록이 바뀌면 캐시된 결과는 무효화됨
         :param tag_set:
         :return:
         """
         self.tag_set = tag_set
+        self.tag_set_version = get_tag_set_version(tag_set=tag_set)
+        self.noun_tag_memo.set_version(version=self.tag_set_version)
+        if self.tag_cache is not None:
+            self.tag_cache.set_version(version=self.tag_set_version)
 
     def text_pretreatment(self, text: str) -> str:
         """
@@ -62,6 +87,20 @@ class TagExtractor:
         :param similarity_point:유사도 비교 필터링 기준점
         :return:결과 태그들
         """
+        # 캐시 확인
+        cache_key = None
+        if self.tag_cache is not None:
+            cache_key = self.tag_cache.make_key(title=title, post_text=post_text, top_n=top_n,
+                                                keyword_ngram_range=keyword_ngram_range, score_point=score_point,
+                                                similarity_point=similarity_point)
+            cached = self.tag_cache.get(key=cache_key)
+            if cached is not None:
+                tag_list, keyword_list = cached
+                if return_keyword:
+                    return list(tag_list), list(keyword_list)
+                else:
+                    return list(tag_list)
+
         # 전처리
         pretreatment_title = self.text_pretreatment(title)
         pretreatment_post_text = self.text_pretreatment(post_text)
@@ -100,6 +139,10 @@ class TagExtractor:
         self._get_tags(noun_keyword_list=post_text_noun_keyword_list, max_n=post_text_max_n,
                        similarity_point=similarity_point, result_tag_set=result_tag_set)
 
+        if self.tag_cache is not None:
+            self.tag_cache.put(key=cache_key, tag_list=list(result_tag_set),
+                               keyword_list=title_noun_keyword_list + post_text_noun_keyword_list)
+
         if return_keyword:
             return list(result_tag_set), title_noun_keyword_list + post_text_noun_keyword_list
         else:
@@ -150,16 +193,34 @@ class TagExtractor:
         index = 0
         count = 0
         while count < max_n and index < len(noun_keyword_list):
-            max_similarity = similarity_point
-            max_similarity_default_tag = None
-            for default_tag in self.tag_set:
-                similarity = self.similarity_comparator.get_similarity(word1=default_tag,
-                                                                       word2=noun_keyword_list[index][0])
-                if max_similarity < similarity:
-                    max_similarity = similarity
-                    max_similarity_default_tag = default_tag
-
+            max_similarity_default_tag, _ = self._get_best_tag(noun=noun_keyword_list[index][0],
+                                                               similarity_point=similarity_point)
             if max_similarity_default_tag is not None:
                 result_tag_set.add(max_similarity_default_tag)
                 count += 1
             index += 1
+
+    def _get_best_tag(self, noun: str, similarity_point: float) -> tuple[Optional[str], Optional[float]]:
+        """
+        명사와 가장 유사한 기본 태그 반환. 결과는 명사, 태그 목록, 기준점에만 의존하므로 메모 테이블에 기억함
+        :param noun: 명사
+        :param similarity_point: 유사도 비교 필터링 기준점
+        :return: (태그, 유사도), 기준점을 초과하는 태그가 없는 경우 (None, None)
+        """
+        memo = self.noun_tag_memo.get(noun=noun, similarity_point=similarity_point)
+        if memo is not None:
+            return memo
+
+        max_similarity = similarity_point
+        max_similarity_default_tag = None
+        for default_tag in self.tag_set:
+            similarity = self.similarity_comparator.get_similarity(word1=default_tag, word2=noun)
+            if max_similarity < similarity:
+                max_similarity = similarity
+                max_similarity_default_tag = default_tag
+
+        if max_similarity_default_tag is None:
+            max_similarity = None
+        self.noun_tag_memo.put(noun=noun, similarity_point=similarity_point, tag=max_similarity_default_tag,
+                               similarity=max_similarity)
+        return max_similarity_default_tag, max_similarity
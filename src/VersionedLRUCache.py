@@ -0,0 +1,76 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class VersionedLRUCache:
+    def __init__(self, max_size: int):
+        """
+        태그 목록 버전이 바뀌면 모두 무효화되는 메모리 LRU 캐시 (TagCache, NounTagMemo에서 사용)
+        :param max_size: 저장할 최대 항목 수 (넘으면 가장 오래 사용되지 않은 항목부터 삭제)
+        """
+        self.max_size = max_size
+        self.version = ''
+        self._cache: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def set_version(self, version: str) -> bool:
+        """
+        태그 목록 버전 재설정. 버전이 바뀌면 저장된 항목은 모두 삭제됨
+        :param version: 태그 목록 버전 (TagCache.get_tag_set_version 참고)
+        :return: 버전이 바뀌었는지 여부
+        """
+        if version == self.version:
+            return False
+        with self._lock:
+            self.version = version
+            self._cache.clear()
+        return True
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        저장된 항목 반환
+        :param key: 키
+        :return: 저장된 값 또는 저장되지 않은 경우 None
+        """
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        항목을 저장하고, 최대 크기를 넘으면 가장 오래 사용되지 않은 항목 삭제
+        :param key: 키
+        :param value: 저장할 값 (None은 저장할 수 없음)
+        """
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        """
+        저장된 항목 모두 삭제
+        """
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        :return: 적중 통계 (hits, misses, size)
+        """
+        return {'hits': self._hits, 'misses': self._misses, 'size': len(self._cache)}
+
+    def __len__(self) -> int:
+        """
+        :return: 저장되어 있는 항목 수
+        """
+        return len(self._cache)
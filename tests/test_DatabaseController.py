@@ -0,0 +1,56 @@
+import pytest
+
+# 데이터베이스에는 연결하지 않지만, 모듈을 불러오려면 mysql-connector와 모델 라이브러리가 필요함
+DatabaseController = pytest.importorskip('SETagExtractor').DatabaseController
+
+
+class FakePostTable:
+    def __init__(self, post_list: list[tuple[int, str, str, str]], answered_id_set: set[int] = None):
+        self.post_list = post_list
+        self.answered_id_set = set() if answered_id_set is None else answered_id_set
+        self.args_list = []
+
+    def execute(self, sql: str, args: tuple = None) -> list[tuple[int, str, str, str]]:
+        self.args_list.append(args)
+        last_id, limit = args
+        result_list = [post for post in self.post_list if last_id < post[0]]
+        if 'answer_tag_post' in sql:
+            result_list = [post for post in result_list if post[0] in self.answered_id_set]
+        return sorted(result_list)[:limit]
+
+
+def _make_database_controller(post_table: FakePostTable) -> DatabaseController:
+    database_controller = DatabaseController.__new__(DatabaseController)
+    database_controller._execute = post_table.execute
+    return database_controller
+
+
+def test_iter_posts_exact_multiple_of_batch_size():
+    post_table = FakePostTable([(post_id, 'title', 'content', 'author') for post_id in (1, 3, 5, 7)])
+    database_controller = _make_database_controller(post_table)
+
+    assert [post[0] for post in database_controller.iter_posts(batch_size=2)] == [1, 3, 5, 7]
+    assert post_table.args_list == [(0, 2), (3, 2), (7, 2)]
+
+
+def test_iter_posts_answered_only():
+    post_table = FakePostTable([(post_id, 'title', 'content', 'author') for post_id in range(1, 6)],
+                               answered_id_set={2, 4, 5})
+    database_controller = _make_database_controller(post_table)
+
+    assert [post[0] for post in database_controller.iter_posts(batch_size=2, answered_only=True)] == [2, 4, 5]
+    assert post_table.args_list == [(0, 2), (4, 2)]
+
+
+def test_iter_posts_replaces_none():
+    post_table = FakePostTable([(1, None, None, None), (2, 'title', 'content', 'author')])
+    database_controller = _make_database_controller(post_table)
+
+    assert list(database_controller.iter_posts(batch_size=10)) == [(1, '', '', ''), (2, 'title', 'content', 'author')]
+
+
+@pytest.mark.parametrize('batch_size', [0, -1])
+def test_iter_posts_invalid_batch_size(batch_size: int):
+    database_controller = _make_database_controller(FakePostTable([]))
+    with pytest.raises(ValueError):
+        database_controller.iter_posts(batch_size=batch_size)
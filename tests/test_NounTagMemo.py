@@ -0,0 +1,42 @@
+from src.NounTagMemo import NounTagMemo
+
+
+def test_no_match_counts_as_hit():
+    noun_tag_memo = NounTagMemo()
+    assert noun_tag_memo.get(noun='자동차', similarity_point=0.75) is None
+    noun_tag_memo.put(noun='자동차', similarity_point=0.75, tag=None, similarity=None)
+
+    assert noun_tag_memo.get(noun='자동차', similarity_point=0.75) == (None, None)
+    assert noun_tag_memo.get_stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+
+def test_version_change_drops_pending():
+    noun_tag_memo = NounTagMemo(track_pending=True)
+    noun_tag_memo.set_version(version='v1')
+    noun_tag_memo.put(noun='사과', similarity_point=0.75, tag='과일', similarity=0.9)
+
+    noun_tag_memo.set_version(version='v2')
+    assert noun_tag_memo.get(noun='사과', similarity_point=0.75) is None
+    assert noun_tag_memo.pop_pending() == []
+
+
+def test_pending_only_when_tracked():
+    noun_tag_memo = NounTagMemo()
+    noun_tag_memo.put(noun='사과', similarity_point=0.75, tag='과일', similarity=0.9)
+    assert noun_tag_memo.pop_pending() == []
+
+    noun_tag_memo = NounTagMemo(track_pending=True)
+    noun_tag_memo.put(noun='사과', similarity_point=0.75, tag='과일', similarity=0.9)
+    assert noun_tag_memo.pop_pending() == [('사과', 0.75, '과일', 0.9)]
+    assert noun_tag_memo.pop_pending() == []
+
+
+def test_similarity_point_rounded_like_persisted_column():
+    noun_tag_memo = NounTagMemo(track_pending=True)
+    noun_tag_memo.put(noun='사과', similarity_point=0.7512345, tag='과일', similarity=0.9)
+    memo_list = noun_tag_memo.pop_pending()
+    assert memo_list == [('사과', 0.75123, '과일', 0.9)]
+
+    reloaded = NounTagMemo()
+    reloaded.load(memo_list=memo_list)
+    assert reloaded.get(noun='사과', similarity_point=0.7512345) == ('과일', 0.9)
@@ -0,0 +1,144 @@
+import threading
+
+from src.TagCache import TagCache, get_tag_set_version
+
+
+def _make_key(tag_cache: TagCache, title: str = '제목', post_text: str = '본문') -> str:
+    return tag_cache.make_key(title=title, post_text=post_text, top_n=5, keyword_ngram_range=(1, 3),
+                              score_point=0.3, similarity_point=0.75)
+
+
+def test_tag_set_version_ignores_order():
+    assert get_tag_set_version({'사과', '바나나'}) == get_tag_set_version({'바나나', '사과'})
+    assert get_tag_set_version({'사과'}) != get_tag_set_version({'사과', '바나나'})
+
+
+def test_memory_stats():
+    tag_cache = TagCache()
+    key = _make_key(tag_cache)
+    assert tag_cache.get(key=key) is None
+    tag_cache.put(key=key, tag_list=['사과'], keyword_list=[('사과', 0.5)])
+
+    assert tag_cache.get(key=key) == (['사과'], [('사과', 0.5)])
+    assert tag_cache.get_stats() == {'hits': 1, 'memory_hits': 1, 'persistent_hits': 0, 'misses': 1,
+                                     'persistent_errors': 0, 'size': 1}
+
+
+def test_version_change_changes_key():
+    tag_cache = TagCache()
+    tag_cache.set_version(version=get_tag_set_version({'사과'}))
+    key = _make_key(tag_cache)
+    tag_cache.put(key=key, tag_list=['사과'], keyword_list=[])
+
+    tag_cache.set_version(version=get_tag_set_version({'사과', '바나나'}))
+    assert _make_key(tag_cache) != key
+    assert tag_cache.get(key=key) is None
+
+
+def test_normalized_text_shares_key():
+    tag_cache = TagCache()
+    assert _make_key(tag_cache, post_text='본문\r\n내용 ') == _make_key(tag_cache, post_text='본문\n내용')
+    assert _make_key(tag_cache, post_text='본문  내용') != _make_key(tag_cache, post_text='본문 내용')
+
+
+def test_sqlite_round_trip(tmp_path):
+    db_path = str(tmp_path / 'tag_cache.sqlite3')
+    writer = TagCache(db_path=db_path)
+    writer.set_version(version='v1')
+    key = _make_key(writer)
+    writer.put(key=key, tag_list=['사과'], keyword_list=[('사과', 0.5), ('바나나', 0.25)])
+
+    reader = TagCache(db_path=db_path)
+    reader.set_version(version='v1')
+    assert reader.get(key=key) == (['사과'], [('사과', 0.5), ('바나나', 0.25)])
+    assert reader.get_stats()['persistent_hits'] == 1
+
+
+def test_sqlite_keeps_other_versions(tmp_path):
+    db_path = str(tmp_path / 'tag_cache.sqlite3')
+    writer = TagCache(db_path=db_path)
+    writer.set_version(version='v1')
+    key = _make_key(writer)
+    writer.put(key=key, tag_list=['사과'], keyword_list=[])
+
+    other = TagCache(db_path=db_path)
+    other.set_version(version='v2')
+    assert other.get(key=key) is None
+
+    reader = TagCache(db_path=db_path)
+    reader.set_version(version='v1')
+    assert reader.get(key=key) == (['사과'], [])
+
+
+def test_sqlite_from_other_thread(tmp_path):
+    tag_cache = TagCache(db_path=str(tmp_path / 'tag_cache.sqlite3'))
+    key = _make_key(tag_cache)
+    tag_cache.put(key=key, tag_list=['사과'], keyword_list=[])
+    tag_cache.clear()
+
+    result_list = []
+    thread = threading.Thread(target=lambda: result_list.append(tag_cache.get(key=key)))
+    thread.start()
+    thread.join()
+    assert result_list == [None]
+
+    tag_cache.put(key=key, tag_list=['사과'], keyword_list=[])
+    thread = threading.Thread(target=lambda: result_list.append(tag_cache.get(key=key)))
+    thread.start()
+    thread.join()
+    assert result_list == [None, (['사과'], [])]
+
+
+def test_sqlite_error_falls_back_to_memory(tmp_path):
+    tag_cache = TagCache(db_path=str(tmp_path / 'missing_directory' / 'tag_cache.sqlite3'))
+    key = _make_key(tag_cache)
+    assert tag_cache.get(key=key) is None
+    tag_cache.put(key=key, tag_list=['사과'], keyword_list=[])
+
+    assert tag_cache.get(key=key) == (['사과'], [])
+    stats = tag_cache.get_stats()
+    assert stats['misses'] == 1
+    assert stats['memory_hits'] == 1
+    assert stats['persistent_errors'] == 2
+
+
+def test_sqlite_prune_by_size(tmp_path):
+    db_path = str(tmp_path / 'tag_cache.sqlite3')
+    writer = TagCache(max_size=10, db_path=db_path, persistent_max_size=2, prune_interval=3)
+    key_list = [_make_key(writer, title=str(index)) for index in range(3)]
+    for key in key_list:
+        writer.put(key=key, tag_list=['사과'], keyword_list=[])
+
+    reader = TagCache(db_path=db_path)
+    assert reader.get(key=key_list[0]) is None
+    assert reader.get(key=key_list[1]) == (['사과'], [])
+    assert reader.get(key=key_list[2]) == (['사과'], [])
+
+
+def test_sqlite_prune_by_age(tmp_path):
+    db_path = str(tmp_path / 'tag_cache.sqlite3')
+    writer = TagCache(db_path=db_path, persistent_max_age=-1)
+    key = _make_key(writer)
+    writer.put(key=key, tag_list=['사과'], keyword_list=[])
+    writer.prune()
+
+    assert TagCache(db_path=db_path).get(key=key) is None
+
+
+def test_sqlite_delete_version(tmp_path):
+    db_path = str(tmp_path / 'tag_cache.sqlite3')
+    old_writer = TagCache(db_path=db_path)
+    old_writer.set_version(version='v1')
+    old_key = _make_key(old_writer)
+    old_writer.put(key=old_key, tag_list=['사과'], keyword_list=[])
+    writer = TagCache(db_path=db_path)
+    writer.set_version(version='v2')
+    key = _make_key(writer)
+    writer.put(key=key, tag_list=['바나나'], keyword_list=[])
+
+    writer.delete_version(version='v1')
+    reader = TagCache(db_path=db_path)
+    reader.set_version(version='v1')
+    assert reader.get(key=old_key) is None
+    reader.set_version(version='v2')
+    assert reader.get(key=key) == (['바나나'], [])
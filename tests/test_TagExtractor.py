@@ -0,0 +1,135 @@
+import pytest
+
+from src.TagCache import TagCache
+
+# 분석기는 아래의 가짜 객체로 대체하지만, 모듈을 불러오려면 모델 라이브러리(pororo, keybert, gensim, kiwipiepy)가 필요함
+TagExtractor = pytest.importorskip('src.TagExtractor').TagExtractor
+
+
+class FakeNamedEntityRecognizer:
+    def __init__(self):
+        self.call_count = 0
+
+    def analyze(self, text: str) -> list[tuple[str, str]]:
+        self.call_count += 1
+        return [(text, 'O')]
+
+
+class FakeToken:
+    def __init__(self, form: str):
+        self.form = form
+        self.tag = 'NNG'
+
+
+class FakeMorphemeAnalyzer:
+    def tokenize(self, text: str) -> list[FakeToken]:
+        return [FakeToken(form=form) for form in text.split()]
+
+    def join(self, morphs: list[FakeToken]) -> str:
+        return ' '.join(token.form for token in morphs)
+
+    def get_sentences(self, text: str) -> list[str]:
+        return [text]
+
+    def get_nouns(self, text: str) -> list[str]:
+        return text.split()
+
+
+class FakeKeyword:
+    def __init__(self, keyword: str, score: float):
+        self._keyword = keyword
+        self._score = score
+
+    def get_keyword(self) -> str:
+        return self._keyword
+
+    def get_score(self) -> float:
+        return self._score
+
+
+class FakeKeywordList:
+    def __init__(self, keyword_list: list[FakeKeyword]):
+        self._keyword_list = keyword_list
+
+    def get_keywords(self) -> list[FakeKeyword]:
+        return self._keyword_list
+
+
+class FakeKeywordExtractor:
+    def __init__(self):
+        self.call_count = 0
+
+    def get_keywords(self, text: str, top_n: int = 10, ngram_range: tuple[int, int] = (1, 3)) -> FakeKeywordList:
+        self.call_count += 1
+        return FakeKeywordList([FakeKeyword(keyword=word, score=0.5) for word in text.split()])
+
+
+class FakeSimilarityComparator:
+    def __init__(self):
+        self.call_count = 0
+
+    def get_similarity(self, word1: str, word2: str) -> float:
+        self.call_count += 1
+        return 1. if word1 == word2 else 0.
+
+
+def _make_tag_extractor(tag_set: set[str], tag_cache: TagCache = None) -> TagExtractor:
+    return TagExtractor(tag_set=tag_set, named_entity_recognizer=FakeNamedEntityRecognizer(),
+                        keyword_extractor=FakeKeywordExtractor(), morpheme_analyzer=FakeMorphemeAnalyzer(),
+                        similarity_comparator=FakeSimilarityComparator(), tag_cache=tag_cache)
+
+
+def test_cache_hit_skips_extraction():
+    tag_extractor = _make_tag_extractor(tag_set={'사과', '바나나'}, tag_cache=TagCache())
+    tag_list, keyword_list = tag_extractor.get_tags(title='사과', post_text='바나나 포도', return_keyword=True)
+    ner_call_count = tag_extractor.named_entity_recognizer.call_count
+    keyword_call_count = tag_extractor.keyword_extractor.call_count
+
+    assert tag_extractor.get_tags(title='사과', post_text='바나나 포도', return_keyword=True) == (tag_list,
+                                                                                              keyword_list)
+    assert sorted(tag_extractor.get_tags(title='사과', post_text='바나나 포도')) == sorted(tag_list)
+    assert sorted(tag_list) == ['바나나', '사과']
+    assert tag_extractor.named_entity_recognizer.call_count == ner_call_count
+    assert tag_extractor.keyword_extractor.call_count == keyword_call_count
+    assert tag_extractor.tag_cache.get_stats()['hits'] == 2
+
+
+def test_set_tag_set_invalidates_cache():
+    tag_extractor = _make_tag_extractor(tag_set={'사과'}, tag_cache=TagCache())
+    assert tag_extractor.get_tags(title='사과', post_text='바나나') == ['사과']
+    keyword_call_count = tag_extractor.keyword_extractor.call_count
+
+    tag_extractor.set_tag_set(tag_set={'바나나'})
+    assert tag_extractor.get_tags(title='사과', post_text='바나나') == ['바나나']
+    assert tag_extractor.keyword_extractor.call_count > keyword_call_count
+
+
+def test_warm_noun_skips_similarity():
+    tag_extractor = _make_tag_extractor(tag_set={'사과', '바나나'})
+    assert tag_extractor._get_best_tag(noun='사과', similarity_point=0.75) == ('사과', 1.)
+    call_count = tag_extractor.similarity_comparator.call_count
+    assert call_count == 2
+
+    assert tag_extractor._get_best_tag(noun='사과', similarity_point=0.75) == ('사과', 1.)
+    assert sorted(tag_extractor.get_tags(title='사과', post_text='사과')) == ['사과']
+    assert tag_extractor.similarity_comparator.call_count == call_count
+
+
+def test_no_match_short_circuits():
+    tag_extractor = _make_tag_extractor(tag_set={'사과', '바나나'})
+    assert tag_extractor._get_best_tag(noun='자동차', similarity_point=0.75) == (None, None)
+    call_count = tag_extractor.similarity_comparator.call_count
+
+    assert tag_extractor._get_best_tag(noun='자동차', similarity_point=0.75) == (None, None)
+    assert tag_extractor.similarity_comparator.call_count == call_count
+    assert tag_extractor.noun_tag_memo.get_stats()['hits'] == 1
+
+
+def test_set_tag_set_rescans_nouns():
+    tag_extractor = _make_tag_extractor(tag_set={'사과'})
+    assert tag_extractor._get_best_tag(noun='바나나', similarity_point=0.75) == (None, None)
+    call_count = tag_extractor.similarity_comparator.call_count
+
+    tag_extractor.set_tag_set(tag_set={'사과', '바나나'})
+    assert tag_extractor._get_best_tag(noun='바나나', similarity_point=0.75) == ('바나나', 1.)
+    assert tag_extractor.similarity_comparator.call_count == call_count + 2
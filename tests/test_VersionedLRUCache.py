@@ -0,0 +1,26 @@
+from src.VersionedLRUCache import VersionedLRUCache
+
+
+def test_lru_eviction():
+    lru_cache = VersionedLRUCache(max_size=2)
+    lru_cache.put(key='a', value=1)
+    lru_cache.put(key='b', value=2)
+    assert lru_cache.get(key='a') == 1
+    lru_cache.put(key='c', value=3)
+
+    assert lru_cache.get(key='b') is None
+    assert lru_cache.get(key='a') == 1
+    assert lru_cache.get(key='c') == 3
+    assert lru_cache.get_stats() == {'hits': 3, 'misses': 1, 'size': 2}
+
+
+def test_version_change_invalidates():
+    lru_cache = VersionedLRUCache(max_size=2)
+    assert lru_cache.set_version(version='v1')
+    lru_cache.put(key='a', value=1)
+
+    assert not lru_cache.set_version(version='v1')
+    assert lru_cache.get(key='a') == 1
+    assert lru_cache.set_version(version='v2')
+    assert lru_cache.get(key='a') is None
+    assert len(lru_cache) == 0